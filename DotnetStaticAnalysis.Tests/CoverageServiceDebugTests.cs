@@ -68,6 +68,48 @@ public class CoverageServiceDebugTests
         Assert.Contains("DotnetStaticAnalysisMcp.IntegrationTests", testProjectNames);
     }
 
+    [Fact]
+    public async Task IsTestProjectAsync_WhenProjectFileChanges_InvalidatesCachedResult()
+    {
+        var method = typeof(CodeCoverageService).GetMethod("IsTestProjectAsync", 
+            BindingFlags.NonPublic | BindingFlags.Instance);
+        
+        Assert.NotNull(method);
+
+        // The project name must not contain "Test", otherwise the naming convention alone decides the result
+        var tempDir = Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString());
+        Directory.CreateDirectory(tempDir);
+        var projectPath = Path.Combine(tempDir, "Library.csproj");
+        var operationId = Guid.NewGuid().ToString();
+
+        try
+        {
+            await File.WriteAllTextAsync(projectPath, @"<Project Sdk=""Microsoft.NET.Sdk"">
+  <ItemGroup>
+    <PackageReference Include=""Newtonsoft.Json"" Version=""13.0.3"" />
+  </ItemGroup>
+</Project>");
+            File.SetLastWriteTimeUtc(projectPath, new DateTime(2024, 1, 1, 0, 0, 0, DateTimeKind.Utc));
+
+            var first = await (Task<bool>)method.Invoke(_coverageService, new object[] { projectPath, operationId })!;
+            Assert.False(first);
+
+            await File.WriteAllTextAsync(projectPath, @"<Project Sdk=""Microsoft.NET.Sdk"">
+  <ItemGroup>
+    <PackageReference Include=""xunit"" Version=""2.9.2"" />
+  </ItemGroup>
+</Project>");
+            File.SetLastWriteTimeUtc(projectPath, new DateTime(2024, 1, 2, 0, 0, 0, DateTimeKind.Utc));
+
+            var second = await (Task<bool>)method.Invoke(_coverageService, new object[] { projectPath, operationId })!;
+            Assert.True(second);
+        }
+        finally
+        {
+            Directory.Delete(tempDir, true);
+        }
+    }
+
     [Fact]
     public async Task DebugIsTestProjectMethod()
     {
@@ -345,6 +345,63 @@ namespace ValidProject
         return workspace;
     }
 
+    /// <summary>
+    /// Creates a workspace with a library whose only diagnostics are warnings and unused usings,
+    /// including the unused field warnings that are only reported for the whole compilation
+    /// </summary>
+    public static AdhocWorkspace CreateWorkspaceWithWarnings(string filePath)
+    {
+        var workspace = new AdhocWorkspace();
+        var references = GetBasicReferences();
+
+        var projectId = ProjectId.CreateNewId();
+        var projectInfo = ProjectInfo.Create(
+            projectId,
+            VersionStamp.Create(),
+            "WarningProject",
+            "WarningProject",
+            LanguageNames.CSharp,
+            compilationOptions: new CSharpCompilationOptions(OutputKind.DynamicallyLinkedLibrary),
+            parseOptions: new CSharpParseOptions(LanguageVersion.Latest),
+            metadataReferences: references);
+
+        var project = workspace.AddProject(projectInfo);
+
+        var holderCode = @"
+using System;
+using System.Text;
+
+namespace WarningProject
+{
+    public class Holder
+    {
+        // CS0169: The field is never used
+        private int _unusedField;
+
+        // CS0414: The field is assigned but its value is never used
+        private int _assignedField = 1;
+
+        public void Run()
+        {
+            // CS0168: The variable is declared but never used
+            int unusedLocal;
+        }
+    }
+}";
+
+        var holderDocument = DocumentInfo.Create(
+            DocumentId.CreateNewId(projectId),
+            "Holder.cs",
+            sourceCodeKind: SourceCodeKind.Regular,
+            loader: TextLoader.From(TextAndVersion.Create(SourceText.From(holderCode), VersionStamp.Create())),
+            filePath: filePath);
+
+        var solutionWithHolder = project.Solution.AddDocument(holderDocument);
+        workspace.TryApplyChanges(solutionWithHolder);
+
+        return workspace;
+    }
+
     /// <summary>
     /// Gets C# code that will generate a specific compiler error
     /// </summary>
@@ -289,6 +289,81 @@ public class RoslynAnalysisServiceSuggestionsTests
         Assert.False(noFixOptions.IncludeManualFix);
     }
 
+    [Fact]
+    public async Task GetFileSuggestionsAsync_WithWarnings_ReturnsNoDuplicateSuggestions()
+    {
+        // Arrange
+        var filePath = Path.Combine(Path.GetTempPath(), "WarningProject", "Holder.cs");
+        using var workspace = InMemoryProjectGenerator.CreateWorkspaceWithWarnings(filePath);
+        var service = CreateServiceWithSolution(workspace.CurrentSolution);
+
+        try
+        {
+            // Act
+            var suggestions = await service.GetFileSuggestionsAsync(filePath);
+
+            // Assert
+            Assert.NotEmpty(suggestions);
+            var duplicates = suggestions
+                .GroupBy(s => new { s.Id, s.StartLine, s.StartColumn })
+                .Where(g => g.Count() > 1)
+                .Select(g => g.Key)
+                .ToList();
+            Assert.Empty(duplicates);
+        }
+        finally
+        {
+            service.Dispose();
+        }
+    }
+
+    [Fact]
+    public async Task GetFileSuggestionsAsync_MatchesSolutionSuggestionsForSameFile()
+    {
+        // Arrange
+        var filePath = Path.Combine(Path.GetTempPath(), "WarningProject", "Holder.cs");
+        using var workspace = InMemoryProjectGenerator.CreateWorkspaceWithWarnings(filePath);
+        var service = CreateServiceWithSolution(workspace.CurrentSolution);
+
+        try
+        {
+            // Act
+            var fileSuggestions = await service.GetFileSuggestionsAsync(filePath);
+            var solutionSuggestions = await service.GetCodeSuggestionsAsync();
+
+            // Assert
+            var fileKeys = fileSuggestions
+                .Select(s => (s.Id, s.StartLine, s.StartColumn))
+                .OrderBy(k => k)
+                .ToList();
+            var solutionKeys = solutionSuggestions
+                .Where(s => s.FilePath == filePath)
+                .Select(s => (s.Id, s.StartLine, s.StartColumn))
+                .OrderBy(k => k)
+                .ToList();
+
+            Assert.Contains(fileKeys, k => k.Id == "CS0169");
+            Assert.Contains(fileKeys, k => k.Id == "CS0414");
+            Assert.Equal(solutionKeys, fileKeys);
+        }
+        finally
+        {
+            service.Dispose();
+        }
+    }
+
+    private RoslynAnalysisService CreateServiceWithSolution(Microsoft.CodeAnalysis.Solution solution)
+    {
+        var service = new RoslynAnalysisService(_logger);
+
+        // Use reflection to load an in-memory solution without going through MSBuild
+        var field = typeof(RoslynAnalysisService).GetField("_currentSolution",
+            System.Reflection.BindingFlags.NonPublic | System.Reflection.BindingFlags.Instance);
+        field!.SetValue(service, solution);
+
+        return service;
+    }
+
     [Fact]
     public async Task RoslynAnalysisService_SuggestionMethods_HandleExceptions_Gracefully()
     {
@@ -1,4 +1,5 @@
 using Microsoft.Extensions.Logging;
+using System.Collections.Concurrent;
 using System.Diagnostics;
 using System.Text.Json;
 using System.Text.RegularExpressions;
@@ -13,9 +14,23 @@ namespace DotnetStaticAnalysisMcp.Server.Services;
 /// </summary>
 public class CodeCoverageService
 {
+    private static readonly Regex TestCountRegex = new(@"(?<kind>Total tests|Total|Passed|Failed|Skipped):\s*(?<count>\d+)", RegexOptions.Compiled);
+    // Atomic digit runs anchored at a run boundary keep long digit sequences in test output from backtracking
+    private static readonly Regex DurationRegex = new(@"(?<!\d)((?>\d+):(?>\d+):(?>\d+)\.(?>\d+))", RegexOptions.Compiled);
+
+    // Test framework packages (not just coverage packages) that mark a project as a test project
+    private static readonly string[] TestFrameworkPackages =
+    {
+        "Microsoft.NET.Test.Sdk",
+        "xunit",
+        "NUnit",
+        "MSTest"
+    };
+
     private readonly ILogger<CodeCoverageService> _logger;
     private readonly RoslynAnalysisService _analysisService;
     private readonly TelemetryService _telemetryService;
+    private readonly ConcurrentDictionary<string, (DateTime LastWriteTimeUtc, bool IsTestProject)> _testProjectCache = new();
     private string? _currentSolutionPath;
 
     public CodeCoverageService(
@@ -486,21 +501,31 @@ public class CodeCoverageService
                 return false;
             }
 
+            // Skip re-reading project files that have not changed since the last analysis
+            var lastWriteTimeUtc = File.GetLastWriteTimeUtc(projectPath);
+            if (_testProjectCache.TryGetValue(projectPath, out var cached) && cached.LastWriteTimeUtc == lastWriteTimeUtc)
+            {
+                _logger.LogInformation("Test project analysis result for {ProjectPath} operation {OperationId}: {IsTestProject} (cached)",
+                    projectPath, operationId, cached.IsTestProject);
+                _telemetryService.LogTelemetry("CodeCoverageService.IsTestProject.Analysis", new Dictionary<string, object>
+                {
+                    ["operation_id"] = operationId,
+                    ["project_path"] = projectPath,
+                    ["project_name"] = Path.GetFileNameWithoutExtension(projectPath),
+                    ["is_test_project"] = cached.IsTestProject,
+                    ["cached"] = true,
+                    ["timestamp"] = DateTime.UtcNow
+                });
+                return cached.IsTestProject;
+            }
+
             var content = await File.ReadAllTextAsync(projectPath);
             _logger.LogDebug("Project file content length: {Length} characters for {ProjectPath} operation {OperationId}",
                 content.Length, projectPath, operationId);
 
             // Check for test framework packages (not just coverage packages)
-            var testFrameworkPackages = new[]
-            {
-                "Microsoft.NET.Test.Sdk",
-                "xunit",
-                "NUnit",
-                "MSTest"
-            };
-
             var foundTestFrameworkPackages = new List<string>();
-            foreach (var package in testFrameworkPackages)
+            foreach (var package in TestFrameworkPackages)
             {
                 if (content.Contains(package, StringComparison.OrdinalIgnoreCase))
                 {
@@ -559,9 +584,11 @@ public class CodeCoverageService
                 ["has_is_test_project"] = hasIsTestProject,
                 ["has_test_in_name"] = hasTestInName,
                 ["content_length"] = content.Length,
+                ["cached"] = false,
                 ["timestamp"] = DateTime.UtcNow
             });
 
+            _testProjectCache[projectPath] = (lastWriteTimeUtc, isTestProject);
             return isTestProject;
         }
         catch (Exception ex)
@@ -674,8 +701,10 @@ public class CodeCoverageService
                 var allFiles = Directory.GetFiles(outputDir, "*", SearchOption.AllDirectories);
                 _logger.LogInformation("Files found in output directory: {Files}", string.Join(", ", allFiles));
 
-                coverageFiles = Directory.GetFiles(outputDir, "*.xml", SearchOption.AllDirectories)
-                    .Where(f => f.Contains("coverage", StringComparison.OrdinalIgnoreCase))
+                // Filter the listing we already have rather than walking the output tree a second time
+                coverageFiles = allFiles
+                    .Where(f => f.EndsWith(".xml", StringComparison.OrdinalIgnoreCase) &&
+                                f.Contains("coverage", StringComparison.OrdinalIgnoreCase))
                     .ToArray();
             }
 
@@ -706,33 +735,34 @@ public class CodeCoverageService
             // Parse dotnet test output for test statistics
             foreach (var line in output)
             {
-                if (line.Contains("Total tests:"))
-                {
-                    var match = Regex.Match(line, @"Total tests:\s*(\d+)");
-                    if (match.Success && int.TryParse(match.Groups[1].Value, out var total))
-                        summary.TotalTests = total;
-                }
-                else if (line.Contains("Passed:"))
-                {
-                    var match = Regex.Match(line, @"Passed:\s*(\d+)");
-                    if (match.Success && int.TryParse(match.Groups[1].Value, out var passed))
-                        summary.PassedTests = passed;
-                }
-                else if (line.Contains("Failed:"))
-                {
-                    var match = Regex.Match(line, @"Failed:\s*(\d+)");
-                    if (match.Success && int.TryParse(match.Groups[1].Value, out var failed))
-                        summary.FailedTests = failed;
-                }
-                else if (line.Contains("Skipped:"))
+                // A single scan picks up every counter on the line, including the
+                // combined "Passed: x, Failed: y, Skipped: z" summary lines
+                foreach (Match match in TestCountRegex.Matches(line))
                 {
-                    var match = Regex.Match(line, @"Skipped:\s*(\d+)");
-                    if (match.Success && int.TryParse(match.Groups[1].Value, out var skipped))
-                        summary.SkippedTests = skipped;
+                    if (!int.TryParse(match.Groups["count"].Value, out var count))
+                        continue;
+
+                    switch (match.Groups["kind"].Value)
+                    {
+                        case "Total tests":
+                        case "Total":
+                            summary.TotalTests = count;
+                            break;
+                        case "Passed":
+                            summary.PassedTests = count;
+                            break;
+                        case "Failed":
+                            summary.FailedTests = count;
+                            break;
+                        case "Skipped":
+                            summary.SkippedTests = count;
+                            break;
+                    }
                 }
-                else if (line.Contains("Test Run Successful") || line.Contains("Test Run Failed"))
+
+                if (line.Contains("Test Run Successful") || line.Contains("Test Run Failed"))
                 {
-                    var timeMatch = Regex.Match(line, @"(\d+:\d+:\d+\.\d+)");
+                    var timeMatch = DurationRegex.Match(line);
                     if (timeMatch.Success && TimeSpan.TryParse(timeMatch.Groups[1].Value, out var duration))
                         summary.ExecutionTime = duration;
                 }
@@ -751,9 +781,11 @@ public class CodeCoverageService
     {
         try
         {
-            foreach (var coverageFile in coverageFiles)
+            // Coverage files are independent, so parse them concurrently and merge in input order
+            var parsedFiles = await Task.WhenAll(coverageFiles.Select(coverageFile => ParseCoberturaFileAsync(coverageFile, options)));
+            foreach (var projects in parsedFiles)
             {
-                await ParseCoberturaFileAsync(result, coverageFile, options);
+                result.Projects.AddRange(projects);
             }
 
             // Calculate overall summary
@@ -766,20 +798,23 @@ public class CodeCoverageService
         }
     }
 
-    private async Task ParseCoberturaFileAsync(CoverageAnalysisResult result, string coverageFile, CoverageAnalysisOptions options)
+    private async Task<List<ProjectCoverage>> ParseCoberturaFileAsync(string coverageFile, CoverageAnalysisOptions options)
     {
+        var projects = new List<ProjectCoverage>();
+
         try
         {
             _logger.LogInformation("Parsing coverage file: {CoverageFile}", coverageFile);
 
-            var content = await File.ReadAllTextAsync(coverageFile);
-            var doc = XDocument.Parse(content);
+            // Load straight from the file stream instead of materializing the whole report as a string first
+            await using var stream = new FileStream(coverageFile, FileMode.Open, FileAccess.Read, FileShare.Read, 4096, useAsync: true);
+            var doc = await XDocument.LoadAsync(stream, LoadOptions.None, CancellationToken.None);
             var coverage = doc.Root;
 
             if (coverage == null || coverage.Name != "coverage")
             {
                 _logger.LogWarning("Invalid Cobertura XML format in file: {CoverageFile}", coverageFile);
-                return;
+                return projects;
             }
 
             // Parse overall coverage metrics
@@ -798,11 +833,12 @@ public class CodeCoverageService
                 var projectCoverage = ParsePackage(package, coverageFile);
                 if (projectCoverage != null)
                 {
-                    result.Projects.Add(projectCoverage);
+                    projects.Add(projectCoverage);
                 }
             }
 
-            _logger.LogInformation("Successfully parsed coverage file with {ProjectCount} projects", result.Projects.Count);
+            _logger.LogInformation("Successfully parsed coverage file with {ProjectCount} projects", projects.Count);
+            return projects;
         }
         catch (Exception ex)
         {
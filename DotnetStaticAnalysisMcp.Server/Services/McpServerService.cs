@@ -386,9 +386,15 @@ public class DotNetAnalysisTools
 
                 try
                 {
-                    // Read last 20 lines of log file
-                    var lines = File.ReadAllLines(logFile);
-                    recentLines = lines.TakeLast(20).ToList();
+                    // Stream the log and keep only the last 20 lines instead of loading the whole file
+                    var tail = new Queue<string>(20);
+                    foreach (var line in File.ReadLines(logFile))
+                    {
+                        if (tail.Count == 20)
+                            tail.Dequeue();
+                        tail.Enqueue(line);
+                    }
+                    recentLines = tail.ToList();
                 }
                 catch (Exception ex)
                 {
@@ -385,7 +385,8 @@ public class RoslynAnalysisService : IDisposable
                 var compilation = await project.GetCompilationAsync();
                 if (compilation == null) continue;
 
-                // Get all diagnostics including analyzer suggestions
+                // Compilation diagnostics already cover the syntax, declaration and method body
+                // diagnostics of every document, so each document is only bound once
                 var diagnostics = compilation.GetDiagnostics();
 
                 foreach (var diagnostic in diagnostics)
@@ -396,33 +397,6 @@ public class RoslynAnalysisService : IDisposable
                         suggestions.Add(suggestion);
                     }
                 }
-
-                // Also get semantic model diagnostics for each document
-                foreach (var document in project.Documents)
-                {
-                    try
-                    {
-                        var semanticModel = await document.GetSemanticModelAsync();
-                        var syntaxTree = await document.GetSyntaxTreeAsync();
-
-                        if (semanticModel != null && syntaxTree != null)
-                        {
-                            var semanticDiagnostics = semanticModel.GetDiagnostics();
-                            foreach (var diagnostic in semanticDiagnostics)
-                            {
-                                var suggestion = ConvertDiagnosticToSuggestion(diagnostic, project.Name);
-                                if (suggestion != null && ShouldIncludeSuggestion(suggestion, options))
-                                {
-                                    suggestions.Add(suggestion);
-                                }
-                            }
-                        }
-                    }
-                    catch (Exception ex)
-                    {
-                        _logger.LogWarning(ex, "Failed to analyze document for suggestions: {DocumentName}", document.Name);
-                    }
-                }
             }
             catch (Exception ex)
             {
@@ -471,12 +445,13 @@ public class RoslynAnalysisService : IDisposable
         try
         {
             var compilation = await document.Project.GetCompilationAsync();
-            var semanticModel = await document.GetSemanticModelAsync();
             var syntaxTree = await document.GetSyntaxTreeAsync();
 
-            if (compilation != null && semanticModel != null && syntaxTree != null)
+            if (compilation != null && syntaxTree != null)
             {
-                // Get compilation diagnostics for this file
+                // Use the compilation diagnostics filtered to this file rather than the document's
+                // semantic model: warnings such as unused private fields (CS0169, CS0414, CS0649)
+                // are only reported when the whole compilation is analyzed
                 var compilationDiagnostics = compilation.GetDiagnostics()
                     .Where(d => d.Location.SourceTree == syntaxTree);
 
@@ -488,17 +463,6 @@ public class RoslynAnalysisService : IDisposable
                         suggestions.Add(suggestion);
                     }
                 }
-
-                // Get semantic model diagnostics
-                var semanticDiagnostics = semanticModel.GetDiagnostics();
-                foreach (var diagnostic in semanticDiagnostics)
-                {
-                    var suggestion = ConvertDiagnosticToSuggestion(diagnostic, document.Project.Name);
-                    if (suggestion != null && ShouldIncludeSuggestion(suggestion, options))
-                    {
-                        suggestions.Add(suggestion);
-                    }
-                }
             }
         }
         catch (Exception ex)
@@ -543,7 +507,7 @@ public class RoslynAnalysisService : IDisposable
             HelpLink = diagnostic.Descriptor.HelpLinkUri,
             ProjectName = projectName,
             CanAutoFix = diagnostic.Descriptor.CustomTags.Contains("Unnecessary") ||
-                        diagnostic.Id.StartsWith("IDE"),
+                        diagnostic.Id.StartsWith("IDE", StringComparison.Ordinal),
             Impact = DetermineImpact(diagnostic.Id, diagnostic.Descriptor.CustomTags)
         };
 
@@ -589,7 +553,7 @@ public class RoslynAnalysisService : IDisposable
         return analyzerId switch
         {
             // IDE suggestions (style and modernization)
-            var id when id.StartsWith("IDE0") => id switch
+            var id when id.StartsWith("IDE0", StringComparison.Ordinal) => id switch
             {
                 "IDE0001" or "IDE0002" or "IDE0003" or "IDE0004" or "IDE0005" => SuggestionCategory.Style,
                 "IDE0007" or "IDE0008" or "IDE0009" or "IDE0010" => SuggestionCategory.Modernization,
@@ -618,19 +582,19 @@ public class RoslynAnalysisService : IDisposable
             },
 
             // Code Analysis rules
-            var id when id.StartsWith("CA1") => SuggestionCategory.Design,
-            var id when id.StartsWith("CA2") => SuggestionCategory.Reliability,
-            var id when id.StartsWith("CA3") => SuggestionCategory.Security,
-            var id when id.StartsWith("CA5") => SuggestionCategory.Security,
+            var id when id.StartsWith("CA1", StringComparison.Ordinal) => SuggestionCategory.Design,
+            var id when id.StartsWith("CA2", StringComparison.Ordinal) => SuggestionCategory.Reliability,
+            var id when id.StartsWith("CA3", StringComparison.Ordinal) => SuggestionCategory.Security,
+            var id when id.StartsWith("CA5", StringComparison.Ordinal) => SuggestionCategory.Security,
 
             // Performance rules
-            var id when id.StartsWith("CA18") => SuggestionCategory.Performance,
+            var id when id.StartsWith("CA18", StringComparison.Ordinal) => SuggestionCategory.Performance,
 
             // Naming rules
-            var id when id.StartsWith("CA17") => SuggestionCategory.Naming,
+            var id when id.StartsWith("CA17", StringComparison.Ordinal) => SuggestionCategory.Naming,
 
             // Documentation rules
-            var id when id.StartsWith("CS1591") => SuggestionCategory.Documentation,
+            var id when id.StartsWith("CS1591", StringComparison.Ordinal) => SuggestionCategory.Documentation,
 
             // Default categorization
             _ => SuggestionCategory.BestPractices
@@ -658,19 +622,19 @@ public class RoslynAnalysisService : IDisposable
     private SuggestionImpact DetermineImpact(string analyzerId, IEnumerable<string> customTags)
     {
         // Performance-related suggestions have higher impact
-        if (analyzerId.StartsWith("CA18") || customTags.Contains("Performance"))
+        if (analyzerId.StartsWith("CA18", StringComparison.Ordinal) || customTags.Contains("Performance"))
             return SuggestionImpact.Significant;
 
         // Security suggestions are major
-        if (analyzerId.StartsWith("CA3") || analyzerId.StartsWith("CA5") || customTags.Contains("Security"))
+        if (analyzerId.StartsWith("CA3", StringComparison.Ordinal) || analyzerId.StartsWith("CA5", StringComparison.Ordinal) || customTags.Contains("Security"))
             return SuggestionImpact.Major;
 
         // Modernization can be moderate to significant
-        if (analyzerId.StartsWith("IDE") && (analyzerId.Contains("90") || analyzerId.Contains("100")))
+        if (analyzerId.StartsWith("IDE", StringComparison.Ordinal) && (analyzerId.Contains("90") || analyzerId.Contains("100")))
             return SuggestionImpact.Moderate;
 
         // Style and cleanup are usually minimal
-        if (customTags.Contains("Unnecessary") || analyzerId.StartsWith("IDE0"))
+        if (customTags.Contains("Unnecessary") || analyzerId.StartsWith("IDE0", StringComparison.Ordinal))
             return SuggestionImpact.Small;
 
         return SuggestionImpact.Minimal;
@@ -890,6 +854,7 @@ public class RoslynAnalysisService : IDisposable
 
             var usages = new List<TypeUsageReference>();
             var projectsWithUsages = new HashSet<string>();
+            var namespacePrefix = namespaceName + ".";
 
             foreach (var project in _currentSolution.Projects)
             {
@@ -899,12 +864,17 @@ public class RoslynAnalysisService : IDisposable
                     if (syntaxTree == null) continue;
 
                     var root = await syntaxTree.GetRootAsync();
-                    var usingDirectives = root.DescendantNodes().OfType<UsingDirectiveSyntax>();
+
+                    // Using directives only live at compilation-unit or namespace level, so
+                    // skip descending into type declarations and member bodies
+                    var usingDirectives = root
+                        .DescendantNodes(node => node is CompilationUnitSyntax or BaseNamespaceDeclarationSyntax)
+                        .OfType<UsingDirectiveSyntax>();
 
                     foreach (var usingDirective in usingDirectives)
                     {
                         var nameText = usingDirective.Name?.ToString();
-                        if (nameText == namespaceName || nameText?.StartsWith(namespaceName + ".") == true)
+                        if (nameText == namespaceName || nameText?.StartsWith(namespacePrefix, StringComparison.Ordinal) == true)
                         {
                             projectsWithUsages.Add(project.Name);
 